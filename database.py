@@ -5,6 +5,72 @@ It provides functionality to link, query, and retrieve NEOs based on
 various criteria, including by designation and name. The database can also be queried to produce
 filtered lists of close approaches based on user-defined filters.
 """
+import bisect
+import itertools
+import operator
+
+from filters import AttributeFilter, DateFilter, compile_filters
+
+
+# For each comparator a `DateFilter` may use, the searches giving the window of time-sorted dates
+# that satisfy it, as (first index, end index) functions of the dates and the reference date.
+_DATE_BOUNDS = {
+    operator.eq: (bisect.bisect_left, bisect.bisect_right),
+    operator.ge: (bisect.bisect_left, None),
+    operator.gt: (bisect.bisect_right, None),
+    operator.le: (None, bisect.bisect_right),
+    operator.lt: (None, bisect.bisect_left),
+}
+
+
+class _Unlinked:
+    """Stand in for an attribute of the NEO of a close approach that has no NEO.
+
+    Every comparison with it is false, so the approach fails any filter on its NEO's attributes.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return False
+
+    __ne__ = __lt__ = __le__ = __gt__ = __ge__ = __eq__
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return '_UNLINKED'
+
+
+_UNLINKED = _Unlinked()
+
+
+def _attribute(filter_class, approach):
+    """Return the attribute a filter class compares for a close approach.
+
+    :param filter_class: A subclass of `AttributeFilter`.
+    :param approach: A `CloseApproach`.
+    :return: The attribute, or `_UNLINKED` if it belongs to an NEO the approach isn't linked to.
+    """
+    try:
+        return filter_class.get(approach)
+    except AttributeError:
+        if approach.neo is None:
+            return _UNLINKED
+        raise
+
+
+def _combine_filters(filters):
+    """Fuse a collection of filters into a single predicate.
+
+    The predicate is the short-circuiting conjunction of the filters, so each close approach is
+    checked with one call rather than passing through a chain of `filter` iterators.
+
+    :param filters: A collection of filters capturing user-specified criteria.
+    :return: A callable that is truthy for close approaches matching every filter.
+    """
+    namespace = {f"f{i}": filter_func for i, filter_func in enumerate(filters)}
+    source = "lambda a: " + " and ".join(f"{name}(a)" for name in namespace)
+    return eval(source, namespace)
 
 
 class NEODatabase:
@@ -21,11 +87,16 @@ class NEODatabase:
         :param approaches: A list of `CloseApproach` objects.
         """
         self._neos = neos
-        self._approaches = approaches
+
+        # Keeping the approaches in time order, so queries produce sorted results without sorting.
+        self._approaches = sorted(approaches, key=operator.attrgetter('time'))
 
         self._neos_by_designation = {neo.designation: neo for neo in self._neos}
         self._neos_by_name = {neo.name: neo for neo in self._neos if neo.name}
 
+        # Per-attribute columns of the close approaches, keyed by filter class and built on demand.
+        self._columns = {}
+
         self._link_neos_and_approaches()
 
     def _link_neos_and_approaches(self):
@@ -40,6 +111,22 @@ class NEODatabase:
                 neo.approaches.append(approach)
                 approach.neo = neo
 
+    def _column(self, filter_class):
+        """Return the values that a filter class compares, for every close approach in order.
+
+        Approaches without an NEO hold `_UNLINKED` in place of any attribute of their NEO, so they
+        never match a filter on it.
+
+        :param filter_class: A subclass of `AttributeFilter`.
+        :return: A tuple holding the attribute of each close approach, aligned with the approaches.
+        """
+        column = self._columns.get(filter_class)
+        if column is None:
+            column = self._columns[filter_class] = tuple(
+                _attribute(filter_class, approach) for approach in self._approaches
+            )
+        return column
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
 
@@ -56,31 +143,65 @@ class NEODatabase:
         """
         return self._neos_by_name.get(name)
 
-    def query(self, filters=()):
+    def query(self, filters=(), limit=None):
         """Query close approaches to generate those that match a collection of filters.
 
+        Since the approaches are searched in time order, a limit stops the search as soon as
+        enough matching approaches have been found.
+
         :param filters: A collection of filters capturing user-specified criteria.
-        :return: A stream of `CloseApproach` objects.
+        :param limit: The maximum number of matches to generate, or None (or <= 0) for all of them.
+        :return: A stream of `CloseApproach` objects, in order of approach time.
         """
-        # Applying filters to the list of approaches.
+        # Applying filters to the approaches, which are already sorted by time.
         filtered_approaches = self._apply_filters(filters)
+        if limit is not None and limit > 0:
+            filtered_approaches = itertools.islice(filtered_approaches, limit)
 
-        # Sorting the filtered approaches by time.
-        sorted_approaches = sorted(filtered_approaches, key=lambda approach: approach.time)
-
-        # Generating and yielding the sorted approaches.
-        for approach in sorted_approaches:
+        # Generating and yielding the filtered approaches.
+        for approach in filtered_approaches:
             yield approach
 
     def _apply_filters(self, filters):
         """Apply a collection of filters to the database's close approaches.
 
         :param filters: A collection of filters capturing user-specified criteria.
-        :return: A list of `CloseApproach` objects.
+        :return: A stream of `CloseApproach` objects.
         """
-        filtered_approaches = self._approaches
-
-        for filter_func in filters:
-            filtered_approaches = filter(filter_func, filtered_approaches)
+        date_filters = []
+        attribute_filters = []
+        other_filters = []
+        for f in filters:
+            if isinstance(f, DateFilter) and f.op in _DATE_BOUNDS:
+                date_filters.append(f)
+            elif isinstance(f, AttributeFilter):
+                attribute_filters.append(f)
+            else:
+                other_filters.append(f)
+
+        # Narrowing the time-sorted approaches to the window allowed by the date filters.
+        lo, hi = 0, len(self._approaches)
+        if date_filters:
+            dates = self._column(DateFilter)
+            for f in date_filters:
+                lower, upper = _DATE_BOUNDS[f.op]
+                if lower is not None:
+                    lo = max(lo, lower(dates, f.value))
+                if upper is not None:
+                    hi = min(hi, upper(dates, f.value))
+
+        # Indexing into the window lazily, so a query starts at its first candidate in constant time
+        # and a limited query only touches the prefix it needs.
+        window = range(lo, max(lo, hi))
+        filtered_approaches = map(self._approaches.__getitem__, window)
+
+        # Evaluating attribute filters with one compiled kernel, in a single pass over their columns.
+        if attribute_filters:
+            kernel = compile_filters(attribute_filters)
+            columns = [map(self._column(type(f)).__getitem__, window) for f in attribute_filters]
+            filtered_approaches = itertools.compress(filtered_approaches, map(kernel, *columns))
+
+        if other_filters:
+            filtered_approaches = filter(_combine_filters(other_filters), filtered_approaches)
 
         return filtered_approaches
@@ -8,11 +8,15 @@ file and returns a list of `CloseApproach` instances.
 Dependencies:
 - csv: For reading CSV files.
 - json: For reading JSON files.
+- operator: For extracting the needed columns from each CSV row and JSON item.
+- sys: For interning designations, which are shared by an NEO and all of its close approaches.
 - models: Contains the definitions for `NearEarthObject` and `CloseApproach` classes.
 """
 
 import csv
 import json
+import operator
+import sys
 
 from models import NearEarthObject, CloseApproach
 
@@ -26,13 +30,28 @@ def load_neos(neo_csv_path):
     neo_objects = []
 
     with open(neo_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+        reader = csv.reader(csvfile)
+
+        # Locating the needed columns once from the header, rather than building a dict per row.
+        header = next(reader)
+        columns = operator.itemgetter(
+            header.index('pdes'), header.index('name'), header.index('diameter'), header.index('pha')
+        )
         for row in reader:
+            # Skipping blank lines and filling short rows with None, as `csv.DictReader` would
+            if not row:
+                continue
+            if len(row) < len(header):
+                row += [None] * (len(header) - len(row))
+            pdes, name, diameter, pha = columns(row)
+
             # Converting fields before constructing the NEO
-            row['name'] = row['name'] if row['name'] else None
-            row['diameter'] = float(row['diameter']) if row['diameter'] else float('nan')
-            row['pha'] = row['pha'] == 'Y'
-            neo = NearEarthObject(**row)
+            neo = NearEarthObject(
+                pdes=sys.intern(pdes) if pdes else pdes,
+                name=name if name else None,
+                diameter=float(diameter) if diameter else float('nan'),
+                pha=pha == 'Y'
+            )
             neo_objects.append(neo)
 
     return neo_objects
@@ -49,13 +68,19 @@ def load_approaches(cad_json_path):
 
     with open(cad_json_path, 'r', encoding='utf-8') as jsonfile:
         data = json.load(jsonfile)
-        for item in data['data']:
-            approach = CloseApproach(
-                des=item[0],
-                cd=item[3],
-                dist=float(item[4]),
-                v_rel=float(item[7])
-            )
-            approach_objects.append(approach)
+
+    # Locating the needed columns once from the field list, rather than indexing each item four times.
+    # Files without a field list are assumed to use the standard CAD API column order.
+    fields = data.get('fields')
+    if fields:
+        columns = operator.itemgetter(
+            fields.index('des'), fields.index('cd'), fields.index('dist'), fields.index('v_rel')
+        )
+    else:
+        columns = operator.itemgetter(0, 3, 4, 7)
+    for des, cd, dist, v_rel in map(columns, data['data']):
+        # Converting here so a malformed distance or velocity raises, rather than defaulting to 0.0
+        approach = CloseApproach(des=sys.intern(des), cd=cd, dist=float(dist), v_rel=float(v_rel))
+        approach_objects.append(approach)
 
     return approach_objects
@@ -2,14 +2,26 @@
 This module provides utilities for filtering close approaches.
 
 It defines filter classes that encapsulate search criteria and apply them to close approach
-instances. The module also provides factory and utility functions for creating filter instances
-and for limiting the results produced by iterators.
+instances. The module also provides factory and utility functions for creating filter instances,
+for compiling them into a single predicate, and for limiting the results produced by iterators.
 """
 
+import functools
 import operator
 import itertools
 
 
+# The Python comparison written in place of each comparator that `compile_filters` can inline.
+_OPERATOR_SYMBOLS = {
+    operator.eq: '==',
+    operator.ne: '!=',
+    operator.ge: '>=',
+    operator.gt: '>',
+    operator.le: '<=',
+    operator.lt: '<',
+}
+
+
 class UnsupportedCriterionError(NotImplementedError):
     """Raise when a filter criterion is unsupported."""
 
@@ -53,13 +65,13 @@ class DateFilter(AttributeFilter):
         """
         Retrieve the date of a given close approach.
 
-        This class method extracts and returns the date (excluding the time) of a provided
-        `CloseApproach` instance.
+        This class method returns the date (excluding the time) of a provided `CloseApproach`
+        instance, which is computed once when the approach is created.
 
         :param approach: A `CloseApproach` instance from which the date will be extracted.
         :return: A date object representing the date of the close approach.
         """
-        return approach.time.date()
+        return approach._date
 
 
 class DistanceFilter(AttributeFilter):
@@ -172,6 +184,46 @@ def create_filters(
     return tuple(filters)
 
 
+def compile_filters(filters):
+    """
+    Compile a collection of attribute filters into a single specialized predicate.
+
+    The predicate is generated from the filters' comparators with their reference values bound in,
+    so for a distance filter and a velocity filter it behaves like
+    `lambda c0, c1: c0 >= 0.2 and c1 <= 30.0`. It is called with the attribute value that each
+    filter would `get` from a close approach, in the same order as the filters, and short-circuits
+    on the first comparison that fails.
+
+    Predicates are memoized on the filters' comparators and reference values, so repeating a query
+    reuses the predicate compiled for it the first time.
+
+    :param filters: A collection of `AttributeFilter`s.
+    :return: The compiled predicate.
+    """
+    signature = tuple((attribute_filter.op, attribute_filter.value) for attribute_filter in filters)
+    try:
+        return _compile_signature(signature)
+    except TypeError:
+        # A reference value that can't be hashed can't be memoized, so it's compiled every time.
+        return _compile_signature.__wrapped__(signature)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_signature(signature):
+    """Compile a predicate for a sequence of (comparator, reference value) pairs."""
+    namespace = {}
+    clauses = []
+    for i, (op, value) in enumerate(signature):
+        namespace[f"v{i}"] = value
+        if op in _OPERATOR_SYMBOLS:
+            clauses.append(f"c{i} {_OPERATOR_SYMBOLS[op]} v{i}")
+        else:
+            namespace[f"op{i}"] = op
+            clauses.append(f"op{i}(c{i}, v{i})")
+    params = ", ".join(f"c{i}" for i in range(len(clauses)))
+    return eval(f"lambda {params}: " + (" and ".join(clauses) or "True"), namespace)
+
+
 def limit(iterator, n=None):
     """Limit the number of items produced by an iterator.
 
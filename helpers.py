@@ -11,6 +11,16 @@ representations display seconds, but NASA's data (and our datetimes!) don't
 provide that level of resolution, so the output format also will not.
 """
 import datetime
+import re
+
+
+# The layout of NASA's `cd` field, and the English month abbreviations it uses.
+_CD_PATTERN = re.compile(r'(\d{4})-([A-Z][a-z]{2})-(\d{2}) (\d{2}):(\d{2})')
+_MONTHS = {
+    month: number for number, month in enumerate(
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1
+    )
+}
 
 
 def cd_to_datetime(calendar_date):
@@ -26,7 +36,13 @@ def cd_to_datetime(calendar_date):
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
-    return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+    # Building the datetime directly is several times faster than `strptime`, which is only used
+    # to report (or handle) anything that doesn't match the expected layout.
+    match = _CD_PATTERN.fullmatch(calendar_date)
+    if match is None or match.group(2) not in _MONTHS:
+        return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
+    year, month, day, hour, minute = match.groups()
+    return datetime.datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute))
 
 
 def datetime_to_str(dt):
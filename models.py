@@ -15,6 +15,8 @@ class NearEarthObject:
     and a flag to denote if it's hazardous.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches', '_fullname')
+
     def __init__(self, **info):
         """
         Initialize a new NearEarthObject.
@@ -31,12 +33,13 @@ class NearEarthObject:
         self.hazardous = bool(info.get('pha', False))
         self.approaches = []
 
+        # Formatting the full name once, since it's needed for every result that's displayed
+        self._fullname = f"{self.designation} ({self.name})" if self.name else self.designation
+
     @property
     def fullname(self):
         """Return the full name of the NEO, combining its designation and optional name."""
-        if self.name:
-            return f"{self.designation} ({self.name})"
-        return self.designation
+        return self._fullname
 
     def __str__(self):
         """Return a string representation of the NEO."""
@@ -55,6 +58,8 @@ class CloseApproach:
     the relative velocity of the NEO, and a reference to the associated NEO.
     """
 
+    __slots__ = ('_designation', 'time', '_date', 'distance', 'velocity', 'neo', '_full_description')
+
     def __init__(self, **info):
         """
         Initialize a new CloseApproach.
@@ -63,6 +68,7 @@ class CloseApproach:
         """
         self._designation = info.get('des', '')  # Designation of the NEO
         self.time = cd_to_datetime(info.get('cd', ''))  # Use the 'cd_to_datetime' function
+        self._date = self.time.date()  # Cached calendar date, used by date filters
         try:
             self.distance = float(info.get('dist', 0.0))  # Convert to float
         except ValueError:
@@ -73,6 +79,7 @@ class CloseApproach:
 
         self.velocity = float(info.get('v_rel', 0.0))  # Convert to float
         self.neo = None  # Reference to the associated NEO, to be set later
+        self._full_description = None  # Formatted on first use, once the NEO has been linked
 
     @property
     def time_str(self):
@@ -82,9 +89,9 @@ class CloseApproach:
     @property
     def full_description(self):
         """Return a full description of the close approach, combining time and NEO's full name."""
-        time_str = self.time_str
-        full_name = f"NEO {self.neo.designation} ({self.neo.name})" if self.neo.name else f"NEO {self.neo.designation}"
-        return f"{time_str} - {full_name}"
+        if self._full_description is None:
+            self._full_description = f"{self.time_str} - NEO {self.neo.fullname}"
+        return self._full_description
 
     def __str__(self):
         """Return a string representation of the close approach."""
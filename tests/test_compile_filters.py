@@ -0,0 +1,58 @@
+"""Check that `compile_filters` fuses attribute filters into a single predicate.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_compile_filters
+
+The compiled predicate takes the attribute each filter would `get` from a
+close approach, in the order of the filters.
+"""
+import datetime
+import operator
+import unittest
+
+from filters import compile_filters, create_filters, DistanceFilter, VelocityFilter
+
+
+class TestCompileFilters(unittest.TestCase):
+    def test_compile_single_filter(self):
+        predicate = compile_filters(create_filters(distance_max=0.5))
+        self.assertTrue(predicate(0.25))
+        self.assertTrue(predicate(0.5))
+        self.assertFalse(predicate(0.75))
+
+    def test_compile_multiple_filters(self):
+        predicate = compile_filters(create_filters(distance_min=0.2, velocity_max=30, hazardous=True))
+        self.assertTrue(predicate(0.3, 25, True))
+        self.assertFalse(predicate(0.1, 25, True))
+        self.assertFalse(predicate(0.3, 35, True))
+        self.assertFalse(predicate(0.3, 25, False))
+
+    def test_compile_date_filter(self):
+        predicate = compile_filters(create_filters(date=datetime.date(2020, 3, 2)))
+        self.assertTrue(predicate(datetime.date(2020, 3, 2)))
+        self.assertFalse(predicate(datetime.date(2020, 3, 3)))
+
+    def test_compile_filter_with_uninlined_comparator(self):
+        predicate = compile_filters((DistanceFilter(operator.is_, None), VelocityFilter(operator.ge, 10)))
+        self.assertTrue(predicate(None, 20))
+        self.assertFalse(predicate(0.1, 20))
+
+    def test_compile_no_filters(self):
+        self.assertTrue(compile_filters(())())
+
+    def test_compile_reuses_predicate_for_same_filters(self):
+        first = compile_filters(create_filters(distance_min=0.1, velocity_max=25))
+        second = compile_filters(create_filters(distance_min=0.1, velocity_max=25))
+        other = compile_filters(create_filters(distance_min=0.2, velocity_max=25))
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_compile_filter_with_unhashable_value(self):
+        predicate = compile_filters((DistanceFilter(operator.eq, [0.1, 0.2]),))
+        self.assertTrue(predicate([0.1, 0.2]))
+        self.assertFalse(predicate([0.3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
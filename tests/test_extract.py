@@ -12,8 +12,10 @@ These tests should pass when Task 2 is complete.
 """
 import collections.abc
 import datetime
+import json
 import pathlib
 import math
+import tempfile
 import unittest
 
 from extract import load_neos, load_approaches
@@ -118,5 +120,60 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestLoadNEOsRowShapes(unittest.TestCase):
+    def test_load_neos_skips_blank_lines_and_fills_short_rows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'neos.csv'
+            path.write_text('pdes,name,diameter,pha\n433,Eros,16.8,N\n\n1,,\n', encoding='utf-8')
+            neos = load_neos(path)
+
+        self.assertEqual(len(neos), 2)
+        eros, short = neos
+        self.assertEqual(eros.designation, '433')
+        self.assertEqual(eros.name, 'Eros')
+        self.assertEqual(eros.diameter, 16.8)
+        self.assertEqual(eros.hazardous, False)
+        self.assertEqual(short.designation, '1')
+        self.assertEqual(short.name, None)
+        self.assertTrue(math.isnan(short.diameter))
+        self.assertEqual(short.hazardous, False)
+
+
+class TestLoadApproachesFieldOrder(unittest.TestCase):
+    ITEM = ['2015 CL', '7', '2458849.5', '2020-Jan-01 00:00', '0.1', '0.09', '0.11', '12.5', '12.4']
+
+    def load(self, data):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'cad.json'
+            path.write_text(json.dumps(data), encoding='utf-8')
+            return load_approaches(path)
+
+    def assert_loaded(self, approaches):
+        self.assertEqual(len(approaches), 1)
+        approach = approaches[0]
+        self.assertEqual(approach._designation, '2015 CL')
+        self.assertEqual(approach.time, datetime.datetime(2020, 1, 1, 0, 0))
+        self.assertEqual(approach.distance, 0.1)
+        self.assertEqual(approach.velocity, 12.5)
+
+    def test_load_approaches_uses_field_positions(self):
+        fields = ['des', 'orbit_id', 'jd', 'cd', 'dist', 'dist_min', 'dist_max', 'v_rel', 'v_inf']
+        order = [8, 7, 6, 5, 4, 3, 2, 1, 0]
+        data = {
+            'fields': [fields[i] for i in order],
+            'data': [[self.ITEM[i] for i in order]],
+        }
+        self.assert_loaded(self.load(data))
+
+    def test_load_approaches_without_fields_uses_standard_positions(self):
+        self.assert_loaded(self.load({'data': [self.ITEM]}))
+
+    def test_load_approaches_rejects_malformed_distance(self):
+        item = list(self.ITEM)
+        item[4] = 'n/a'
+        with self.assertRaises(ValueError):
+            self.load({'data': [item]})
+
+
 if __name__ == '__main__':
     unittest.main()
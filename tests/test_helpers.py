@@ -0,0 +1,58 @@
+"""Check that NASA's calendar dates are converted to and from datetimes.
+
+The `cd_to_datetime` function parses the usual `YYYY-bb-DD hh:mm` layout
+directly, and hands anything else to `strptime` - so both paths should agree
+with `strptime`, and anything `strptime` rejects should raise a `ValueError`.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+CD_FORMAT = "%Y-%b-%d %H:%M"
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def assert_matches_strptime(self, calendar_date):
+        expected = datetime.datetime.strptime(calendar_date, CD_FORMAT)
+        self.assertEqual(cd_to_datetime(calendar_date), expected)
+
+    def test_standard_layout_matches_strptime(self):
+        self.assert_matches_strptime('1900-Jan-01 00:00')
+        self.assert_matches_strptime('2020-Dec-31 23:59')
+        self.assert_matches_strptime('1969-Jul-29 12:34')
+
+    def test_every_month_matches_strptime(self):
+        for month in ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'):
+            self.assert_matches_strptime(f'2020-{month}-15 06:30')
+
+    def test_other_layouts_fall_back_to_strptime(self):
+        self.assert_matches_strptime('2020-Jan-1 00:00')
+        self.assert_matches_strptime('2020-jan-01 00:00')
+
+    def test_invalid_day_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Feb-30 00:00')
+
+    def test_invalid_month_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('2020-Foo-01 00:00')
+
+    def test_empty_string_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            cd_to_datetime('')
+
+
+class TestDatetimeToStr(unittest.TestCase):
+    def test_datetime_to_str_omits_seconds(self):
+        self.assertEqual(datetime_to_str(datetime.datetime(2020, 12, 31, 12, 0, 59)), '2020-12-31 12:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
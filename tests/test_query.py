@@ -19,6 +19,7 @@ import unittest
 from database import NEODatabase
 from extract import load_neos, load_approaches
 from filters import create_filters
+from models import NearEarthObject, CloseApproach
 
 
 TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
@@ -528,6 +529,58 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    #########################
+    # Ordering and limiting #
+    #########################
+
+    def test_query_produces_approaches_in_time_order(self):
+        filters = create_filters(velocity_max=20)
+        times = [approach.time for approach in self.db.query(filters)]
+        self.assertGreater(len(times), 0)
+        self.assertEqual(times, sorted(times))
+
+    def test_query_with_limit(self):
+        velocity_max = 20
+
+        expected = sorted(
+            (approach for approach in self.approaches if approach.velocity <= velocity_max),
+            key=lambda approach: approach.time
+        )[:5]
+        self.assertEqual(len(expected), 5)
+
+        filters = create_filters(velocity_max=velocity_max)
+        received = list(self.db.query(filters, limit=5))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
+    def test_query_without_limit(self):
+        filters = create_filters()
+        self.assertEqual(len(list(self.db.query(filters, limit=None))), len(self.approaches))
+        self.assertEqual(len(list(self.db.query(filters, limit=0))), len(self.approaches))
+
+
+class TestQueryWithUnlinkedApproaches(unittest.TestCase):
+    def setUp(self):
+        self.neo = NearEarthObject(pdes='433', name='Eros', diameter=16.84, pha=True)
+        self.linked = CloseApproach(des='433', cd='2020-Jan-01 00:00', dist=0.1, v_rel=5.0)
+        self.unlinked = CloseApproach(des='UNKNOWN', cd='2020-Dec-01 00:00', dist=0.1, v_rel=5.0)
+        self.db = NEODatabase([self.neo], [self.linked, self.unlinked])
+
+    def test_unlinked_approach_outside_date_window_is_skipped(self):
+        end_date = datetime.date(2020, 6, 1)
+        filters = create_filters(end_date=end_date, diameter_min=0.5)
+        self.assertEqual(list(self.db.query(filters)), [self.linked])
+        filters = create_filters(end_date=end_date, hazardous=True)
+        self.assertEqual(list(self.db.query(filters)), [self.linked])
+
+    def test_unlinked_approach_fails_neo_filters(self):
+        self.assertEqual(list(self.db.query(create_filters(diameter_max=100))), [self.linked])
+        self.assertEqual(list(self.db.query(create_filters(hazardous=True))), [self.linked])
+        self.assertEqual(list(self.db.query(create_filters(hazardous=False))), [])
+
+    def test_unlinked_approach_matches_approach_filters(self):
+        filters = create_filters(start_date=datetime.date(2020, 6, 1), distance_max=0.5)
+        self.assertEqual(list(self.db.query(filters)), [self.unlinked])
+
 
 if __name__ == '__main__':
     unittest.main()
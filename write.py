@@ -27,22 +27,24 @@ def write_to_csv(results, filename):
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
     with open(filename, mode='w', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer = csv.writer(file)
 
         # Writing the header row
-        writer.writeheader()
+        writer.writerow(fieldnames)
 
-        # Writing each close approach as a row in the CSV file
-        for approach in results:
-            writer.writerow({
-                'datetime_utc': approach.time_str,
-                'distance_au': approach.distance,
-                'velocity_km_s': approach.velocity,
-                'designation': approach.neo.designation,
-                'name': approach.neo.name,
-                'diameter_km': approach.neo.diameter,
-                'potentially_hazardous': approach.neo.hazardous
-            })
+        # Writing each close approach as a row in the CSV file, in the order of the fieldnames
+        writer.writerows(
+            (
+                approach.time_str,
+                approach.distance,
+                approach.velocity,
+                approach.neo.designation,
+                approach.neo.name,
+                approach.neo.diameter,
+                approach.neo.hazardous
+            )
+            for approach in results
+        )
 
 
 def write_to_json(results, filename):
@@ -50,26 +52,29 @@ def write_to_json(results, filename):
     Export a list of close approach objects to a JSON file.
 
     The exported data is structured in a list where each entry is a dictionary representing
-    a close approach and its associated NEO.
+    a close approach and its associated NEO. Entries are written as they are produced, so
+    `results` may be a stream.
 
     :param results: A list of `CloseApproach` objects.
     :param filename: The desired location and name of the exported JSON file.
     """
-    data = []
-
-    # Creating a list of dictionaries representing close approaches and their NEOs
-    for approach in results:
-        approach_data = {
-            'datetime_utc': approach.time_str,
-            'distance_au': approach.distance,
-            'velocity_km_s': approach.velocity,
-            'neo': {
-                'designation': approach.neo.designation,
-                'name': approach.neo.name,
-                'diameter_km': approach.neo.diameter,
-                'potentially_hazardous': approach.neo.hazardous
-            }
-        }
-        data.append(approach_data)
     with open(filename, mode='w') as file:
-        json.dump(data, file, indent=2)
+        # Streaming the JSON array one close approach at a time, laid out as `json.dump` with an
+        # indent of 2 would, so the results are never all held in memory at once.
+        file.write('[')
+        separator = '\n'
+        for approach in results:
+            approach_data = {
+                'datetime_utc': approach.time_str,
+                'distance_au': approach.distance,
+                'velocity_km_s': approach.velocity,
+                'neo': {
+                    'designation': approach.neo.designation,
+                    'name': approach.neo.name,
+                    'diameter_km': approach.neo.diameter,
+                    'potentially_hazardous': approach.neo.hazardous
+                }
+            }
+            file.write(separator + '  ' + json.dumps(approach_data, indent=2).replace('\n', '\n  '))
+            separator = ',\n'
+        file.write(']' if separator == '\n' else '\n]')